@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Transparent scrolling stock ticker overlay for the top of the screen.
-Uses Yahoo Finance chart API for price data, GTK3+Cairo for rendering.
+Uses the Yahoo Finance v7 quote API (batched, cookie+crumb authenticated)
+for price data, GTK3+Cairo for rendering.
 Supports both X11 and Wayland (via gtk-layer-shell).
 Left-click for settings, right-click to quit.
 """
@@ -23,19 +24,20 @@ import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('Gdk', '3.0')
 gi.require_version('PangoCairo', '1.0')
-from gi.repository import Gtk, Gdk, GLib, Pango, PangoCairo
-import cairo
+from gi.repository import Gtk, Gdk, GLib, Pango
 import threading
 import time
 import signal
 import sys
 import subprocess
-import os
 import json as jsonlib
-import platform
 from datetime import datetime
 import zoneinfo
-from curl_cffi import requests
+import queue
+
+# PangoCairo and pycairo are imported on the first draw (see _import_render)
+PangoCairo = None
+cairo = None
 
 IS_MACOS = platform.system() == "Darwin"
 
@@ -54,6 +56,7 @@ if IS_WAYLAND and not IS_MACOS:
 # ── Defaults ─────────────────────────────────────────────────────────────────
 
 CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ticker-config.json")
+QUOTE_CACHE_PATH = CONFIG_PATH + ".quotes"
 
 DEFAULTS = {
     "symbols": ["AAPL", "GOOGL", "MSFT", "AMZN", "TSLA",
@@ -64,17 +67,43 @@ DEFAULTS = {
     "item_gap": 40,
     "bg_alpha": 0.55,
     "update_interval_min": 15,
+    "use_curl_cffi": False,
 }
 
 COLOR_UP   = (0.0, 0.9, 0.2)
 COLOR_DOWN = (0.9, 0.15, 0.15)
 COLOR_FLAT = (0.7, 0.7, 0.7)
+COLOR_TIME = (0.8, 0.8, 0.8, 0.9)
+COLOR_BG   = (0.05, 0.05, 0.1)
+
+GLYPH_CACHE_MAX = 512
+MAX_SURFACE_WIDTH = 32767  # cairo image surface / X pixmap limit, in device pixels
 
 MAX_RETRIES = 3
 RETRY_DELAY = 30
+QUOTE_BATCH_SIZE = 50
+MAX_REDIRECTS = 3
+POOL_MAXSIZE = 10
+# 429 is deliberately left out: _fetch_batch reports it as rate limiting
+RETRY_STATUSES = (500, 502, 503, 504)
+
+YAHOO_BASE_URL = "https://query2.finance.yahoo.com/"
+YAHOO_QUOTE_URL = YAHOO_BASE_URL + "v7/finance/quote"
+YAHOO_CRUMB_URL = YAHOO_BASE_URL + "v1/test/getcrumb"
+# Responds 404 but sets the consent cookie that getcrumb requires
+YAHOO_COOKIE_URL = "https://fc.yahoo.com/"
+YAHOO_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0",
+    "Connection": "keep-alive",
+}
 
-YAHOO_CHART_URL = "https://query2.finance.yahoo.com/v8/finance/chart/{symbol}?range=5d&interval=1d"
-YAHOO_HEADERS = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0"}
+
+def _import_render():
+    global PangoCairo, cairo
+    if PangoCairo is None:
+        from gi.repository import PangoCairo as _pangocairo
+        import cairo as _cairo
+        PangoCairo, cairo = _pangocairo, _cairo
 
 
 # ── Runtime config ───────────────────────────────────────────────────────────
@@ -90,6 +119,7 @@ class Config:
         self.item_gap = DEFAULTS["item_gap"]
         self.bg_alpha = DEFAULTS["bg_alpha"]
         self.update_interval_min = DEFAULTS["update_interval_min"]
+        self.use_curl_cffi = DEFAULTS["use_curl_cffi"]
         self.load()
 
     @property
@@ -100,6 +130,11 @@ class Config:
     def bar_height(self):
         return self.ticker_font_size + 24
 
+    def rebuild_fonts(self):
+        """Recreate the cached Pango font descriptions after a font size change."""
+        self._sym_font = Pango.FontDescription(f"Sans Bold {self.ticker_font_size}")
+        self._price_font = Pango.FontDescription(f"Sans {self.price_font_size}")
+
     def load(self):
         try:
             with open(CONFIG_PATH) as f:
@@ -109,6 +144,7 @@ class Config:
                     setattr(self, k, v)
         except (FileNotFoundError, jsonlib.JSONDecodeError):
             pass
+        self.rebuild_fonts()
 
     def save(self):
         d = {
@@ -119,6 +155,7 @@ class Config:
             "item_gap": self.item_gap,
             "bg_alpha": self.bg_alpha,
             "update_interval_min": self.update_interval_min,
+            "use_curl_cffi": self.use_curl_cffi,
         }
         with open(CONFIG_PATH, "w") as f:
             jsonlib.dump(d, f, indent=2)
@@ -126,85 +163,247 @@ class Config:
 
 # ── Stock data ───────────────────────────────────────────────────────────────
 
+def make_quote(symbol, price, change, pct, ts):
+    """Build a quote dict, including the display string and color the
+    ticker draws, so neither is recomputed per frame."""
+    up = change >= 0
+    arrow = "\u25B2" if up else "\u25BC"
+    if change == 0:
+        color = COLOR_FLAT
+    else:
+        color = COLOR_UP if up else COLOR_DOWN
+    return {
+        "symbol": symbol, "price": price,
+        "change": change, "pct": pct, "up": up,
+        "ts": ts,
+        "display": f" ${price:.2f} {arrow}{abs(pct):.1f}%",
+        "color": color,
+    }
+
+
 class StockStore:
-    """Fetches and stores stock quotes via Yahoo Finance chart API."""
+    """Fetches and stores stock quotes via Yahoo Finance quote API."""
 
     def __init__(self, cfg):
         self.cfg = cfg
+        # Writers serialize on lock; readers take _snapshot, an immutable
+        # (quotes_tuple, market_time) pair that is only ever rebound whole
         self.lock = threading.Lock()
-        self.quotes = []
-        self.market_time_str = ""
-        self.session = requests.Session(impersonate="chrome")
-        self.session.headers.update(YAHOO_HEADERS)
+        self._snapshot = ((), "")
+        self._adapter_retries = False
+        self._crumb = None
+        self._crumb_lock = threading.Lock()
+        self.session = self._make_session()
+        self._load_cache()
+        # Network I/O only ever runs on daemon threads so quitting never
+        # waits on an in-flight request
+        threading.Thread(target=self._prefetch_crumb, daemon=True).start()
+
+    def _make_session(self):
+        """Return a requests session with a keep-alive pool and retry/backoff
+        in its adapter, or a curl_cffi Chrome-impersonating session if
+        use_curl_cffi is set and the package is installed."""
+        if self.cfg.use_curl_cffi:
+            try:
+                from curl_cffi import requests as curl_requests, CurlHttpVersion
+            except ImportError:
+                print("[stock-ticker] curl_cffi not available, falling back to requests", file=sys.stderr)
+            else:
+                session = curl_requests.Session(
+                    impersonate="chrome",
+                    http_version=CurlHttpVersion.V2TLS,
+                    max_redirects=MAX_REDIRECTS,
+                )
+                session.headers.update(YAHOO_HEADERS)
+                session.headers["Accept-Encoding"] = "gzip, br"
+                return session
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        session.headers.update(YAHOO_HEADERS)
+        session.max_redirects = MAX_REDIRECTS
+        retry = Retry(total=MAX_RETRIES, backoff_factor=1, status_forcelist=RETRY_STATUSES)
+        session.mount("https://", HTTPAdapter(
+            pool_connections=2, pool_maxsize=POOL_MAXSIZE, max_retries=retry))
+        self._adapter_retries = True
+        return session
+
+    def _prefetch_crumb(self):
+        """Obtain the consent cookie and crumb ahead of the first fetch.
+        With requests this also leaves a keep-alive connection in the shared
+        pool; curl_cffi's connections are per-thread, so there only the
+        cookie and crumb carry over to later fetches."""
+        try:
+            self._get_crumb()
+        except Exception as e:
+            print(f"[stock-ticker] crumb prefetch failed: {e}", file=sys.stderr)
+
+    def _load_cache(self):
+        """Seed quotes from the on-disk cache so the ticker can paint immediately."""
+        try:
+            with open(QUOTE_CACHE_PATH) as f:
+                d = jsonlib.load(f)
+            by_symbol = {q["symbol"]: make_quote(q["symbol"], q["price"], q["change"],
+                                                 q["pct"], q.get("ts", 0))
+                         for q in d["quotes"]}
+            market_time = d.get("market_time", "")
+        except (FileNotFoundError, jsonlib.JSONDecodeError, KeyError, TypeError):
+            return
+        self._snapshot = (tuple(by_symbol[s] for s in self.cfg.symbols if s in by_symbol),
+                          market_time)
 
-    def fetch(self):
-        for attempt in range(1, MAX_RETRIES + 1):
+    def _save_cache(self, quotes, market_time):
+        d = {
+            "ts": time.time(),
+            "market_time": market_time,
+            "quotes": quotes,
+        }
+        tmp = f"{QUOTE_CACHE_PATH}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                jsonlib.dump(d, f)
+            os.replace(tmp, QUOTE_CACHE_PATH)
+        except OSError as e:
+            print(f"[stock-ticker] could not write quote cache: {e}", file=sys.stderr)
+
+    def stale_symbols(self):
+        """Return configured symbols with no cached quote younger than the refresh interval."""
+        ttl = self.cfg.update_interval_min * 60
+        now = time.time()
+        quotes, _ = self._snapshot
+        fetched = {q["symbol"]: q.get("ts", 0) for q in quotes}
+        return [s for s in self.cfg.symbols
+                if s not in fetched or now - fetched[s] >= ttl]
+
+    def fetch(self, symbols=None):
+        """Fetch the given symbols (default: all configured) and merge them into the cache."""
+        if symbols is None:
+            symbols = list(self.cfg.symbols)
+        # The requests adapter already retries 5xx with backoff; only the
+        # curl_cffi session needs the manual retry loop
+        attempts = 1 if self._adapter_retries else MAX_RETRIES
+        for attempt in range(1, attempts + 1):
             try:
-                new_quotes, market_time = self._fetch_all()
+                new_quotes, market_time = self._fetch_all(symbols)
                 if new_quotes:
                     with self.lock:
-                        self.quotes = new_quotes
-                        self.market_time_str = market_time
+                        old_quotes, old_market_time = self._snapshot
+                        by_symbol = {q["symbol"]: q for q in old_quotes}
+                        by_symbol.update((q["symbol"], q) for q in new_quotes)
+                        snapshot = (tuple(by_symbol[s] for s in self.cfg.symbols if s in by_symbol),
+                                    market_time or old_market_time)
+                        self._snapshot = snapshot
+                        # Write under the lock so overlapping fetches can't
+                        # leave an older snapshot on disk
+                        self._save_cache(*snapshot)
                     print(f"[stock-ticker] fetched {len(new_quotes)} quotes", file=sys.stderr)
                     return
             except Exception as e:
-                print(f"[stock-ticker] attempt {attempt}/{MAX_RETRIES}: {e}", file=sys.stderr)
-                if attempt < MAX_RETRIES:
+                print(f"[stock-ticker] attempt {attempt}/{attempts}: {e}", file=sys.stderr)
+                if attempt < attempts:
                     time.sleep(RETRY_DELAY)
         print("[stock-ticker] all attempts failed, keeping cached data", file=sys.stderr)
 
-    def _fetch_all(self):
-        new_quotes = []
+    def _fetch_all(self, symbols):
+        """Fetch symbols in batches of QUOTE_BATCH_SIZE, preserving the given order."""
+        batches = [symbols[i:i + QUOTE_BATCH_SIZE]
+                   for i in range(0, len(symbols), QUOTE_BATCH_SIZE)]
+        if len(batches) == 1:
+            results = [self._fetch_batch(batches[0])]
+        else:
+            results = self._fetch_concurrently(batches)
+
+        by_symbol = {}
         market_time_str = ""
-        for sym in self.cfg.symbols:
-            result = self._fetch_one(sym)
-            if result is None:
-                continue
+        for result in results:
             if result == "RATE_LIMITED":
                 raise RuntimeError("rate limited (429)")
-            quote, ts = result
+            quotes, ts = result
+            by_symbol.update(quotes)
             if not market_time_str and ts:
                 market_time_str = ts
-            new_quotes.append(quote)
-            time.sleep(0.5)
+
+        new_quotes = [by_symbol[sym] for sym in symbols if sym in by_symbol]
         return new_quotes, market_time_str
 
-    def _fetch_one(self, symbol):
-        """Fetch a single symbol. Returns (quote_dict, timestamp_str), None, or 'RATE_LIMITED'."""
-        url = YAHOO_CHART_URL.format(symbol=symbol)
-        resp = self.session.get(url, timeout=10)
+    def _fetch_concurrently(self, batches):
+        """Fetch each batch on its own daemon thread and yield results as they
+        arrive. The first error is re-raised; batches still in flight are
+        left to finish in the background and their results discarded."""
+        results = queue.Queue()
+
+        def worker(batch):
+            try:
+                results.put((True, self._fetch_batch(batch)))
+            except Exception as e:
+                results.put((False, e))
+
+        for batch in batches:
+            threading.Thread(target=worker, args=(batch,), daemon=True).start()
+        for _ in batches:
+            ok, result = results.get()
+            if not ok:
+                raise result
+            yield result
+
+    def _get_crumb(self, rejected=None):
+        """Return the crumb the quote API requires, bootstrapping the consent
+        cookie and crumb on first use or when `rejected` was refused."""
+        with self._crumb_lock:
+            if self._crumb is None or self._crumb == rejected:
+                self.session.get(YAHOO_COOKIE_URL, timeout=10)
+                resp = self.session.get(YAHOO_CRUMB_URL, timeout=10)
+                resp.raise_for_status()
+                crumb = resp.text.strip()
+                if not crumb or "<" in crumb:
+                    raise RuntimeError("could not obtain Yahoo crumb")
+                self._crumb = crumb
+            return self._crumb
+
+    def _fetch_batch(self, symbols):
+        """Fetch a batch of symbols in one request.
+        Returns ({symbol: quote_dict}, timestamp_str) or 'RATE_LIMITED'."""
+        crumb = self._get_crumb()
+        params = {"symbols": ",".join(symbols), "crumb": crumb}
+        resp = self.session.get(YAHOO_QUOTE_URL, params=params, timeout=10)
+        if resp.status_code == 401:
+            # Crumb expired or cookie dropped; refresh once and retry
+            params["crumb"] = self._get_crumb(rejected=crumb)
+            resp = self.session.get(YAHOO_QUOTE_URL, params=params, timeout=10)
         if resp.status_code == 429:
             return "RATE_LIMITED"
         resp.raise_for_status()
         data = resp.json()
-        result = data["chart"]["result"][0]
-        closes = result["indicators"]["adjclose"][0]["adjclose"]
-        closes = [c for c in closes if c is not None]
-        if len(closes) < 2:
-            return None
-        cur = closes[-1]
-        prev = closes[-2]
-        change = cur - prev
-        pct = (change / prev) * 100 if prev else 0
-
-        # Extract market time from the first symbol
+
+        quotes = {}
         ts = ""
-        try:
-            meta = result["meta"]
-            tz = zoneinfo.ZoneInfo(meta["exchangeTimezoneName"])
-            dt = datetime.fromtimestamp(meta["regularMarketTime"], tz=tz)
-            ts = dt.strftime("%a %b %d  %I:%M %p %Z")
-        except Exception:
-            pass
+        fetched_at = time.time()
+        for r in data["quoteResponse"]["result"]:
+            cur = r.get("regularMarketPrice")
+            if cur is None:
+                continue
+            change = r.get("regularMarketChange") or 0
+            pct = r.get("regularMarketChangePercent") or 0
+            quotes[r["symbol"]] = make_quote(r["symbol"], cur, change, pct, fetched_at)
+
+            # Extract market time from the first symbol that has one
+            if not ts:
+                try:
+                    tz = zoneinfo.ZoneInfo(r["exchangeTimezoneName"])
+                    dt = datetime.fromtimestamp(r["regularMarketTime"], tz=tz)
+                    ts = dt.strftime("%a %b %d  %I:%M %p %Z")
+                except Exception:
+                    pass
 
-        return {
-            "symbol": symbol, "price": cur,
-            "change": change, "pct": pct, "up": change >= 0,
-        }, ts
+        return quotes, ts
 
     def get_quotes(self):
-        with self.lock:
-            return list(self.quotes), self.market_time_str
+        """Return the current (quotes, market_time) snapshot without locking.
+        The quotes tuple is replaced, never mutated, on each fetch; callers
+        must treat the quote dicts as read-only."""
+        return self._snapshot
 
 
 # ── Settings menu ────────────────────────────────────────────────────────────
@@ -307,6 +506,7 @@ def _on_font_size(item, win, size):
     if not item.get_active():
         return
     win.cfg.ticker_font_size = size
+    win.cfg.rebuild_fonts()
     win.apply_config()
 
 def _on_scroll_speed(item, win, val):
@@ -320,6 +520,7 @@ def _on_opacity(item, win, val):
         return
     win.cfg.bg_alpha = val
     win.cfg.save()
+    win.invalidate_content()
 
 def _on_interval(item, win, val):
     if not item.get_active():
@@ -390,9 +591,23 @@ class TickerWindow(Gtk.Window):
         super().__init__(title="Stock Ticker")
         self.cfg = cfg
         self.store = store
-        self.scroll_x = 0.0
+        self.scroll_x = 0
+        self._scroll_accum = 0.0
         self.content_width = 0
+        self._measure_cache = (None, 0, None)
+        self._content_surface = None
+        self._content_items = None
+        self._layout = None
+        self._glyph_cache = {}
+        self._scratch_cr = (None, None)
+        self._strut = None
+        self._strut_queue = None
         self._anim_source = None
+        self._last_frame_time = None
+        self._visible = False
+        self._mapped = False
+        self._hidden_state = False
+        self._obscured = False
         self._refresh_source = None
         self._use_layer_shell = HAS_LAYER_SHELL
 
@@ -442,6 +657,17 @@ class TickerWindow(Gtk.Window):
         self.drawing_area.connect("button-press-event", self.on_click)
         self.add(self.drawing_area)
 
+        # Pause the animation while unmapped, minimized or fully covered
+        self.add_events(Gdk.EventMask.VISIBILITY_NOTIFY_MASK)
+        self.connect("map", self._on_map, True)
+        self.connect("unmap", self._on_map, False)
+        self.connect("window-state-event", self._on_window_state)
+        self.connect("visibility-notify-event", self._on_visibility)
+
+        # Re-render cached content at the new resolution when the window
+        # moves to a monitor with a different scale factor
+        self.connect("notify::scale-factor", self._on_scale_factor)
+
         # Reserve screen space once the window is mapped (X11 only)
         if not self._use_layer_shell:
             self.connect("realize", self._set_strut)
@@ -489,16 +715,35 @@ class TickerWindow(Gtk.Window):
         #   left_start_y, left_end_y, right_start_y, right_end_y,
         #   top_start_x, top_end_x, bottom_start_x, bottom_end_x
         strut = f"0, 0, {top}, 0, 0, 0, 0, 0, 0, {self.screen_width - 1}, 0, 0"
-        subprocess.run([
-            "xprop", "-id", str(xid),
-            "-f", "_NET_WM_STRUT_PARTIAL", "32c",
-            "-set", "_NET_WM_STRUT_PARTIAL", strut,
-        ], check=False)
+        if (xid, strut) == self._strut:
+            return
+        self._strut = (xid, strut)
+        # Run xprop off the main thread so window setup isn't blocked on it.
+        # A single worker applies updates in order, so the latest always wins.
+        if self._strut_queue is None:
+            self._strut_queue = queue.Queue()
+            threading.Thread(target=self._strut_worker, daemon=True).start()
+        self._strut_queue.put(self._strut)
+
+    def _strut_worker(self):
+        while True:
+            xid, strut = self._strut_queue.get()
+            # Coalesce to the most recent pending value
+            while True:
+                try:
+                    xid, strut = self._strut_queue.get_nowait()
+                except queue.Empty:
+                    break
+            subprocess.run([
+                "xprop", "-id", str(xid),
+                "-f", "_NET_WM_STRUT_PARTIAL", "32c",
+                "-set", "_NET_WM_STRUT_PARTIAL", strut,
+            ], check=False)
 
     def _start_timers(self):
-        if self._anim_source:
-            GLib.source_remove(self._anim_source)
-        self._anim_source = GLib.timeout_add(1000 // self.cfg.fps, self.on_tick)
+        # Animation follows the GDK frame clock (one tick per compositor frame)
+        if self._anim_source is None:
+            self._anim_source = self.drawing_area.add_tick_callback(self.on_tick)
 
         if self._refresh_source:
             GLib.source_remove(self._refresh_source)
@@ -512,27 +757,81 @@ class TickerWindow(Gtk.Window):
         self._start_timers()
         self.cfg.save()
         self.resize(self.screen_width, self.cfg.bar_height)
-        self.drawing_area.queue_draw()
+        self._glyph_cache.clear()
+        self.invalidate_content()
 
     def _initial_fetch(self):
-        threading.Thread(target=self._do_fetch, daemon=True).start()
+        # Paint cached quotes right away; only hit the network for stale ones
+        self.drawing_area.queue_draw()
+        stale = self.store.stale_symbols()
+        if stale:
+            threading.Thread(target=self._do_fetch, args=(stale,), daemon=True).start()
         return False
 
     def _periodic_fetch(self):
         threading.Thread(target=self._do_fetch, daemon=True).start()
         return True
 
-    def _do_fetch(self):
-        self.store.fetch()
-        GLib.idle_add(self.drawing_area.queue_draw)
+    def _do_fetch(self, symbols=None):
+        self.store.fetch(symbols)
+        GLib.idle_add(self._on_quotes_updated)
 
-    def on_tick(self):
-        self.scroll_x -= self.cfg.scroll_speed
-        # Reset once a full content width has scrolled by to avoid overflow
-        if self.content_width > 0 and self.scroll_x <= -self.content_width:
-            self.scroll_x += self.content_width
+    def invalidate_content(self):
+        """Drop the rendered ticker content so the next draw rebuilds it."""
+        self._content_surface = None
+        self._content_items = None
         self.drawing_area.queue_draw()
-        return True
+
+    def _on_quotes_updated(self):
+        self.invalidate_content()
+        return False
+
+    def _update_visible(self):
+        self._visible = self._mapped and not self._hidden_state and not self._obscured
+        if self._visible:
+            self.drawing_area.queue_draw()
+
+    def _on_map(self, widget, mapped):
+        self._mapped = mapped
+        self._update_visible()
+
+    def _on_window_state(self, widget, event):
+        hidden = Gdk.WindowState.WITHDRAWN | Gdk.WindowState.ICONIFIED
+        self._hidden_state = bool(event.new_window_state & hidden)
+        self._update_visible()
+        return False
+
+    def _on_visibility(self, widget, event):
+        self._obscured = event.state == Gdk.VisibilityState.FULLY_OBSCURED
+        self._update_visible()
+        return False
+
+    def _on_scale_factor(self, widget, pspec):
+        self.invalidate_content()
+
+    def on_tick(self, widget, frame_clock):
+        if not self._visible:
+            # Restart the frame interval on resume so we don't jump ahead
+            self._last_frame_time = None
+            return GLib.SOURCE_CONTINUE
+
+        # scroll_speed is pixels per 1/fps s; scale by the real frame interval
+        # so velocity is independent of the compositor's refresh rate
+        now = frame_clock.get_frame_time()
+        dt_ms = 0 if self._last_frame_time is None else (now - self._last_frame_time) / 1000
+        self._last_frame_time = now
+        # Scroll in whole pixels, carrying the fraction over to the next frame
+        self._scroll_accum += self.cfg.scroll_speed * dt_ms / (1000 / self.cfg.fps)
+        pix = int(self._scroll_accum)
+        if pix == 0:
+            return GLib.SOURCE_CONTINUE
+        self._scroll_accum -= pix
+        self.scroll_x -= pix
+        # Keep scroll_x within (-content_width, 0] to avoid overflow
+        if self.content_width > 0:
+            self.scroll_x %= -self.content_width
+        self.drawing_area.queue_draw_area(0, 0, self.screen_width, self.cfg.bar_height)
+        return GLib.SOURCE_CONTINUE
 
     def on_click(self, widget, event):
         if event.button == 1:  # left-click → settings
@@ -544,109 +843,211 @@ class TickerWindow(Gtk.Window):
     # ── Drawing ──────────────────────────────────────────────────────────
 
     def on_draw(self, widget, cr):
+        _import_render()
         cfg = self.cfg
-        cr.set_operator(cairo.OPERATOR_SOURCE)
-        cr.set_source_rgba(0.05, 0.05, 0.1, cfg.bg_alpha)
-        cr.paint()
-        cr.set_operator(cairo.OPERATOR_OVER)
-
         quotes, market_time = self.store.get_quotes()
-        if not quotes:
-            self._draw_loading(cr, cfg)
+        if quotes and self._content_items is None:
+            self._rebuild_surface(self._get_layout(cr), quotes, cfg, market_time)
+
+        cr.set_operator(cairo.OPERATOR_SOURCE)
+        if self._content_surface is None:
+            cr.set_source_rgba(*COLOR_BG, cfg.bg_alpha)
+            cr.paint()
+            cr.set_operator(cairo.OPERATOR_OVER)
+            if not quotes or self._content_items is None:
+                self._draw_loading(cr, self._get_layout(cr), cfg)
+                return
+            # Content too wide to cache in one surface; draw it directly
+            layout = self._get_layout(cr)
+            x = self.scroll_x
+            while x < self.screen_width:
+                self._draw_items(cr, layout, self._content_items, x, cfg, market_time)
+                x += self.content_width
             return
 
-        layout = PangoCairo.create_layout(cr)
-        total_w = self._measure_content(layout, quotes, cfg, market_time)
+        # The content surface holds one copy of the items (and its own
+        # background); repeating it horizontally covers the bar from any
+        # scroll offset, so one OPERATOR_SOURCE fill does the whole frame.
+        # Cairo limits it to the damaged clip region.
+        src_x = -self.scroll_x % self.content_width
+        cr.set_source_surface(self._content_surface, -src_x, 0)
+        cr.get_source().set_extend(cairo.EXTEND_REPEAT)
+        cr.rectangle(0, 0, self.screen_width, cfg.bar_height)
+        cr.fill()
+
+    def _get_layout(self, cr):
+        """Return the window's single PangoLayout, updated for cr."""
+        if self._layout is None:
+            self._layout = PangoCairo.create_layout(cr)
+            # Text lands on transparent glyph tiles, where subpixel AA can't
+            # be composited correctly; grayscale AA is set once for the layout
+            font_options = cairo.FontOptions()
+            font_options.set_antialias(cairo.ANTIALIAS_GRAY)
+            PangoCairo.context_set_font_options(self._layout.get_context(), font_options)
+        else:
+            PangoCairo.update_layout(cr, self._layout)
+        return self._layout
+
+    def _rebuild_surface(self, layout, quotes, cfg, market_time):
+        """Render one copy of the ticker items, with the bar background baked
+        in, into an offscreen surface so each frame only has to blit it.
+        If the content is wider than a surface may be, only the measured
+        items are kept and on_draw draws them directly.
+        Invalidated by invalidate_content() whenever quotes or config change."""
+        total_w, items = self._measure_content(layout, quotes, cfg, market_time)
         self.content_width = total_w
+        if total_w <= 0:
+            return
+        self._content_items = items
+        if total_w * self.get_scale_factor() > MAX_SURFACE_WIDTH:
+            return
 
-        # Tile enough copies to seamlessly fill the entire screen width
-        if total_w > 0:
-            start_x = self.scroll_x % total_w - total_w
-            x = start_x
-            while x < self.screen_width:
-                self._draw_items(cr, quotes, x, cfg, market_time)
-                x += total_w
-
-    def _draw_loading(self, cr, cfg):
-        layout = PangoCairo.create_layout(cr)
-        font = Pango.FontDescription(f"Sans Bold {cfg.ticker_font_size}")
-        layout.set_font_description(font)
+        # Match the window's backend (e.g. an X server pixmap) so the per-frame
+        # blit needs no format conversion; fall back to an image surface
+        gdk_window = self.drawing_area.get_window()
+        if gdk_window is not None:
+            surface = gdk_window.create_similar_surface(
+                cairo.CONTENT_COLOR_ALPHA, total_w, cfg.bar_height)
+        else:
+            scale = self.get_scale_factor()
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32,
+                                         total_w * scale, cfg.bar_height * scale)
+            surface.set_device_scale(scale, scale)
+        surface_cr = cairo.Context(surface)
+        surface_cr.set_operator(cairo.OPERATOR_SOURCE)
+        surface_cr.set_source_rgba(*COLOR_BG, cfg.bg_alpha)
+        surface_cr.paint()
+        surface_cr.set_operator(cairo.OPERATOR_OVER)
+        self._draw_items(surface_cr, self._get_layout(surface_cr),
+                         items, 0, cfg, market_time)
+        surface.flush()
+        self._content_surface = surface
+
+    def _draw_loading(self, cr, layout, cfg):
+        layout.set_font_description(cfg._sym_font)
         layout.set_text("Loading stock data...", -1)
         cr.set_source_rgba(0.7, 0.7, 0.7, 0.8)
         cr.move_to(20, (cfg.bar_height - cfg.ticker_font_size) / 2 - 2)
         PangoCairo.show_layout(cr, layout)
 
     def _measure_content(self, layout, quotes, cfg, market_time):
+        """Return (total_width, items) where items holds the pre-measured
+        timestamp and per-quote widths plus the baseline y for each font.
+        Cached until the quotes, font size, gap, market time or scale change."""
+        key = (quotes, cfg.ticker_font_size, cfg.item_gap, market_time,
+               self.get_scale_factor())
+        cached_key, total, items = self._measure_cache
+        if cached_key is not None and cached_key == key:
+            return total, items
+
         total = 0
-        sym_font = Pango.FontDescription(f"Sans Bold {cfg.ticker_font_size}")
-        price_font = Pango.FontDescription(f"Sans {cfg.price_font_size}")
+        ts_w = None
+        quote_items = []
 
         # Market date/time prefix
         if market_time:
-            layout.set_font_description(price_font)
-            layout.set_text(market_time, -1)
-            ts_w, _ = layout.get_pixel_size()
+            ts_w = self._text_width(layout, market_time, cfg._price_font, COLOR_TIME)
             total += ts_w + cfg.item_gap
 
         for q in quotes:
-            layout.set_font_description(sym_font)
-            layout.set_text(q["symbol"], -1)
-            sym_w, _ = layout.get_pixel_size()
-
-            layout.set_font_description(price_font)
-            arrow = "\u25B2" if q["up"] else "\u25BC"
-            price_str = f" ${q['price']:.2f} {arrow}{abs(q['pct']):.1f}%"
-            layout.set_text(price_str, -1)
-            price_w, _ = layout.get_pixel_size()
-
+            color = q["color"]
+            sym_w = self._text_width(layout, q["symbol"], cfg._sym_font, (*color, 1.0))
+            price_w = self._text_width(layout, q["display"], cfg._price_font, (*color, 0.85))
+            quote_items.append((q, sym_w, price_w))
             total += sym_w + price_w + cfg.item_gap
-        return total
 
-    def _draw_items(self, cr, quotes, x_start, cfg, market_time):
+        items = (ts_w, quote_items,
+                 self._font_baseline(layout, cfg._sym_font, cfg),
+                 self._font_baseline(layout, cfg._price_font, cfg))
+        self._measure_cache = (key, total, items)
+        return total, items
+
+    def _tile_context(self, scale):
+        """Scratch context on the same kind of surface the glyph tiles use,
+        so layouts are measured with the metrics they will be rendered with."""
+        cached_scale, cr = self._scratch_cr
+        if cached_scale != scale:
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, scale, scale)
+            surface.set_device_scale(scale, scale)
+            cr = cairo.Context(surface)
+            self._scratch_cr = (scale, cr)
+        return cr
+
+    def _font_baseline(self, layout, font, cfg):
+        """Baseline y, in the bar, that vertically centres a line of font."""
+        PangoCairo.update_layout(self._tile_context(self.get_scale_factor()), layout)
+        layout.set_font_description(font)
+        layout.set_text("", -1)
+        _, h = layout.get_pixel_size()
+        return (cfg.bar_height - h) // 2 + layout.get_baseline() // Pango.SCALE
+
+    def _glyph_tile(self, layout, char, font, font_key, rgba):
+        """Return a cached (surface, width, baseline) tile holding one
+        character rendered in the given font and color; sizes are logical
+        pixels. Prices change intraday but are drawn from a tiny alphabet,
+        so rebuilding the content surface never reshapes text."""
+        scale = self.get_scale_factor()
+        key = (char, font_key, rgba, scale)
+        tile = self._glyph_cache.get(key)
+        if tile is None:
+            if len(self._glyph_cache) >= GLYPH_CACHE_MAX:
+                self._glyph_cache.clear()
+            PangoCairo.update_layout(self._tile_context(scale), layout)
+            layout.set_font_description(font)
+            layout.set_text(char, -1)
+            w, h = layout.get_pixel_size()
+            w, h = max(w, 1), max(h, 1)
+            baseline = layout.get_baseline() // Pango.SCALE
+            # Rasterize at the device scale so HiDPI text stays sharp; the
+            # tile is still addressed in logical (w, h) units
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w * scale, h * scale)
+            surface.set_device_scale(scale, scale)
+            tile_cr = cairo.Context(surface)
+            PangoCairo.update_layout(tile_cr, layout)
+            tile_cr.set_source_rgba(*rgba)
+            PangoCairo.show_layout(tile_cr, layout)
+            surface.flush()
+            tile = (surface, w, baseline)
+            self._glyph_cache[key] = tile
+        return tile
+
+    def _text_width(self, layout, text, font, rgba):
+        """Logical pixel width of text when drawn with _blit_text."""
+        font_key = font.to_string()
+        return sum(self._glyph_tile(layout, ch, font, font_key, rgba)[1] for ch in text)
+
+    def _blit_text(self, cr, layout, text, x, y_baseline, font, rgba):
+        """Draw text from glyph tiles with every tile's baseline on
+        y_baseline, and return the x position after it."""
+        font_key = font.to_string()
+        for ch in text:
+            tile, tile_w, tile_baseline = self._glyph_tile(layout, ch, font, font_key, rgba)
+            cr.set_source_surface(tile, x, y_baseline - tile_baseline)
+            cr.paint()
+            x += tile_w
+        return x
+
+    def _draw_items(self, cr, layout, items, x_start, cfg, market_time):
         x = x_start
-        sym_font = Pango.FontDescription(f"Sans Bold {cfg.ticker_font_size}")
-        price_font = Pango.FontDescription(f"Sans {cfg.price_font_size}")
-        layout = PangoCairo.create_layout(cr)
+        ts_w, quote_items, sym_baseline, price_baseline = items
 
         # Market date/time prefix
-        if market_time:
-            layout.set_font_description(price_font)
-            layout.set_text(market_time, -1)
-            ts_w, ts_h = layout.get_pixel_size()
-            y_ts = (cfg.bar_height - ts_h) / 2
-            cr.set_source_rgba(0.8, 0.8, 0.8, 0.9)
-            cr.move_to(x, y_ts)
-            PangoCairo.show_layout(cr, layout)
-            x += ts_w + cfg.item_gap
+        if ts_w is not None:
+            x = self._blit_text(cr, layout, market_time, x, price_baseline,
+                                cfg._price_font, COLOR_TIME)
+            x += cfg.item_gap
 
-        for q in quotes:
-            color = COLOR_UP if q["up"] else COLOR_DOWN
-            if q["change"] == 0:
-                color = COLOR_FLAT
+        for q, _, _ in quote_items:
+            color = q["color"]
 
             # Symbol
-            layout.set_font_description(sym_font)
-            layout.set_text(q["symbol"], -1)
-            sym_w, sym_h = layout.get_pixel_size()
-            y_sym = (cfg.bar_height - sym_h) / 2
-
-            cr.set_source_rgb(*color)
-            cr.move_to(x, y_sym)
-            PangoCairo.show_layout(cr, layout)
-            x += sym_w
+            x = self._blit_text(cr, layout, q["symbol"], x, sym_baseline,
+                                cfg._sym_font, (*color, 1.0))
 
             # Price + change
-            layout.set_font_description(price_font)
-            arrow = "\u25B2" if q["up"] else "\u25BC"
-            price_str = f" ${q['price']:.2f} {arrow}{abs(q['pct']):.1f}%"
-            layout.set_text(price_str, -1)
-            price_w, price_h = layout.get_pixel_size()
-            y_price = (cfg.bar_height - price_h) / 2
-
-            cr.set_source_rgba(*color, 0.85)
-            cr.move_to(x, y_price)
-            PangoCairo.show_layout(cr, layout)
-            x += price_w + cfg.item_gap
+            x = self._blit_text(cr, layout, q["display"], x, price_baseline,
+                                cfg._price_font, (*color, 0.85))
+            x += cfg.item_gap
 
 
 # ── Main ─────────────────────────────────────────────────────────────────────